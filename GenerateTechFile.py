@@ -75,8 +75,13 @@ from bpy_extras.io_utils import ExportHelper
 import subprocess
 import dependencie_importer
 import math
-from collections import namedtuple
-from textwrap import wrap
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+from collections import defaultdict, namedtuple
 import functools
 
 Dependency = namedtuple("Dependency", ["module", "package", "name"])
@@ -114,6 +119,10 @@ fig_template = r"""
 
 # config options:
 
+# Print per-object debug information such as the collected path options.
+# Console writes are slow in Blender, so this is off by default.
+DEBUG = False
+
 
 bl_info = {
     "name": "Export Curve as TikZ",
@@ -135,8 +144,6 @@ bl_info = {
 X = 0
 Y = 1
 
-used_materials = {}
-
 
 # Utility functions
 
@@ -159,21 +166,181 @@ def nsplit(seq, n=2):
     return [xy for xy in zip(*[iter(seq)] * n)]
 
 
-def mreplace(s, chararray, newchararray):
-    for a, b in zip(chararray, newchararray):
-        s = s.replace(a, b)
-    return s
+def wrap_tokens(tokens, width=80, indent="  "):
+    """Join path tokens with spaces, breaking into indented lines so no line
+    grows longer than width.
 
+    Works on the token stream we already produce, so no re-tokenizing of the
+    assembled string is needed.
+    """
+    parts = []
+    col = 0
+    for token in tokens:
+        if col == 0:
+            parts.append(token)
+            col = len(token)
+        elif col + len(token) + 1 > width:
+            parts.append("\n" + indent + token)
+            col = len(indent) + len(token)
+        else:
+            parts.append(" " + token)
+            col += len(token) + 1
+    return "".join(parts)
 
+
+# Characters that are unsafe in TikZ node/style names and their replacements.
+_TIKZ_TRANS = str.maketrans(r'\,:.', '-+_*')
+
+
+@functools.lru_cache(maxsize=None)
 def tikzify(s):
     if s.strip():
-        return mreplace(s, r'\,:.', '-+_*')
+        return s.translate(_TIKZ_TRANS)
     else:
         return ""
 
 
-def cmp(a, b):
-    return (a > b) - (a < b)
+# Optional JIT-compiled formatting kernels. Formatting coordinates with
+# "%.4f" dominates export time for dense curves, so when Numba is available
+# the bezier path string is built by a compiled kernel writing ASCII bytes
+# directly into a uint8 buffer. Without Numba the plain Python path is used.
+
+if njit is not None:
+    @njit(cache=True)
+    def _write_fixed(buf, pos, value):
+        # Emit "+%.4f" as fixed-point: a literal '+', the sign, the whole
+        # part and exactly four decimals.
+        buf[pos] = 43  # '+'
+        pos += 1
+        iv = int(round(value * 10000.0))
+        if iv < 0:
+            buf[pos] = 45  # '-'
+            pos += 1
+            iv = -iv
+        whole = iv // 10000
+        frac = iv % 10000
+        if whole == 0:
+            buf[pos] = 48  # '0'
+            pos += 1
+        else:
+            ndig = 0
+            w = whole
+            while w > 0:
+                ndig += 1
+                w //= 10
+            for i in range(ndig - 1, -1, -1):
+                buf[pos + i] = 48 + whole % 10
+                whole //= 10
+            pos += ndig
+        buf[pos] = 46  # '.'
+        pos += 1
+        for i in range(3, -1, -1):
+            buf[pos + i] = 48 + frac % 10
+            frac //= 10
+        pos += 4
+        return pos
+
+    @njit(cache=True)
+    def _write_point(buf, pos, x, y):
+        buf[pos] = 40  # '('
+        pos = _write_fixed(buf, pos + 1, x)
+        buf[pos] = 44  # ','
+        pos = _write_fixed(buf, pos + 1, y)
+        buf[pos] = 41  # ')'
+        return pos + 1
+
+    @njit(cache=True)
+    def _format_bezier_path(knots, handles, cyclic, wrap_lines):
+        """Format a bezier spline as a TikZ path segment.
+
+        knots is an (N,2) float32 array, handles an (M,2,2) float32 array of
+        (control1, control2) pairs already rotated/trimmed for the cyclic or
+        open case. With wrap_lines each segment goes on its own indented
+        line, otherwise segments are separated by single spaces. Returns the
+        used slice of a uint8 buffer holding the same characters the Python
+        formatting path produces.
+        """
+        n = knots.shape[0]
+        m = handles.shape[0]
+        buf = np.empty(64 + (m + 1) * 256, dtype=np.uint8)
+        nl = 10 if wrap_lines else 32  # '\n' or ' '
+        pos = _write_point(buf, 0, knots[0, 0], knots[0, 1])
+        buf[pos] = nl
+        pos += 1
+        for i in range(m):
+            if wrap_lines:
+                buf[pos] = 32
+                buf[pos + 1] = 32
+                pos += 2
+            # ".. controls "
+            for b in (46, 46, 32, 99, 111, 110, 116, 114, 111, 108, 115, 32):
+                buf[pos] = b
+                pos += 1
+            pos = _write_point(buf, pos, handles[i, 0, 0], handles[i, 0, 1])
+            for b in (32, 97, 110, 100, 32):  # " and "
+                buf[pos] = b
+                pos += 1
+            pos = _write_point(buf, pos, handles[i, 1, 0], handles[i, 1, 1])
+            for b in (32, 46, 46, 32):  # " .. "
+                buf[pos] = b
+                pos += 1
+            k = (i + 1) % n
+            pos = _write_point(buf, pos, knots[k, 0], knots[k, 1])
+            buf[pos] = nl
+            pos += 1
+        if cyclic:
+            if wrap_lines:
+                buf[pos] = 32
+                buf[pos + 1] = 32
+                pos += 2
+            for b in (45, 45, 32, 99, 121, 99, 108, 101):  # "-- cycle"
+                buf[pos] = b
+                pos += 1
+            buf[pos] = nl
+            pos += 1
+        return buf[:pos]
+
+    @njit(cache=True)
+    def _format_coord_block(xy):
+        """Format an (N,2) float32 array as newline separated "(+x,+y)"
+        coordinate tokens in a uint8 buffer."""
+        n = xy.shape[0]
+        buf = np.empty(16 + n * 80, dtype=np.uint8)
+        pos = 0
+        for i in range(n):
+            if i:
+                buf[pos] = 10  # '\n'
+                pos += 1
+            pos = _write_point(buf, pos, xy[i, 0], xy[i, 1])
+        return buf[:pos]
+else:
+    _format_bezier_path = None
+    _format_coord_block = None
+
+
+def format_coords(xy):
+    """Turn an (N,2) float32 array into a list of "(+%.4f,+%.4f)" strings.
+
+    Uses the JIT kernel when available and a vectorized np.char formatter
+    otherwise, so neither path formats row by row in the interpreter.
+    """
+    if len(xy) == 0:
+        return []
+    if _format_coord_block is not None:
+        return _format_coord_block(xy).tobytes().decode('ascii').split('\n')
+    return list(np.char.add(np.char.mod('(+%.4f,', xy[:, 0]),
+                            np.char.mod('+%.4f)', xy[:, 1])))
+
+
+def _warm_numba():
+    """Compile the formatting kernels so the first export does not pay the
+    JIT cold-start cost."""
+    if _format_bezier_path is None:
+        return
+    knots = np.zeros((2, 2), dtype=np.float32)
+    handles = np.zeros((1, 2, 2), dtype=np.float32)
+    _format_bezier_path(knots, handles, False, True)
+    _format_coord_block(knots)
 
 
 def copy_to_clipboard(text):
@@ -202,25 +369,24 @@ def get_property(obj, name):
     Looks first in custom properties, then game properties. Returns a list.
     """
     prop_value = []
-    try:
-        prop_value.append(obj.properties[name])
-    except:
-        pass
-    try:
-        # look for game properties
-        prop = obj.getProperty(name)
-        if prop.type == "STRING" and prop.data.strip():
+    props = getattr(obj, 'properties', None)
+    if props is not None:
+        value = props.get(name)
+        if value is not None:
+            prop_value.append(value)
+    # look for game properties
+    get_game_property = getattr(obj, 'getProperty', None)
+    if get_game_property is not None:
+        prop = get_game_property(name)
+        if prop and prop.type == "STRING" and prop.data.strip():
             prop_value.append(prop.data)
-    except:
-        pass
     return prop_value
 
 
-def get_material(material):
-    """Convert material to TikZ options"""
+def get_material(material, used_materials):
+    """Convert material to TikZ options and record it in used_materials"""
     if not material:
         return ""
-    opts = ""
     mat_name = tikzify(material.name)
     used_materials[mat_name] = material
     return mat_name
@@ -233,18 +399,15 @@ def write_materials(used_materials, ONLY_PROPERTIES):
     c = "% Materials section \n"
     for material in used_materials.values():
         mat_name = tikzify(material.name)
-        matopts = ''
-        proponly = ONLY_PROPERTIES
-        try:
-            proponly = material.properties['onlyproperties']
-            if proponly and type(proponly) == str:
-                proponly = proponly.lower() not in ('0', 'false')
-        except:
-            pass
-        try:
-            matopts = material.properties['style']
-        except:
-            pass
+        props = getattr(material, 'properties', None)
+        if props is not None:
+            matopts = props.get('style', '')
+            proponly = props.get('onlyproperties', ONLY_PROPERTIES)
+        else:
+            matopts = ''
+            proponly = ONLY_PROPERTIES
+        if proponly and type(proponly) == str:
+            proponly = proponly.lower() not in ('0', 'false')
 
         rgb = material.rgbCol
         spec = material.specCol
@@ -264,9 +427,12 @@ def write_materials(used_materials, ONLY_PROPERTIES):
     return c
 
 
-def write_object(obj, empties, USE_PLOTPATH, WRAP_LINES, DRAW_CURVE, FILL_CLOSED_CURVE, TRANSFORM_CURVE,
-                 EXPORT_MATERIALS, EMPTIES):
+def write_object(obj, info, empties, used_materials, USE_PLOTPATH, WRAP_LINES, DRAW_CURVE, FILL_CLOSED_CURVE,
+                 TRANSFORM_CURVE, EXPORT_MATERIALS, EMPTIES):
     """Write Curves
+    :param info: cached (type, name, location, rotation z, scale,
+       world translation) tuple for obj, see write_tex
+    :param used_materials: dict the materials seen this export are added to
     :param DRAW_CURVE:
     :param FILL_CLOSED_CURVE:
     :param TRANSFORM_CURVE:
@@ -275,54 +441,72 @@ def write_object(obj, empties, USE_PLOTPATH, WRAP_LINES, DRAW_CURVE, FILL_CLOSED
     :param USE_PLOTPATH:
     :param WRAP_LINES:
     """
-    s = ""
-    name = obj.name
-
-    x, y, z = obj.location
-    rot = obj.rotation_euler
-    scale_x, scale_y, scale_z = obj.scale
-
-    rot_z = rot.z
-    if obj.type not in ["CURVE", "Empty"]:
-        return s
+    obj_type = info[0]
+    if obj_type not in ("CURVE", "Empty"):
+        return ""
+    s_parts = []
+    _, name, (x, y, z), rot_z, (scale_x, scale_y, scale_z), world_translation = info
 
-    ps = ""
-    if obj.type == 'CURVE':
+    ps_parts = []
+    if obj_type == 'CURVE':
         curvedata = obj.data
-        s += "%% %s\n" % name
+        s_parts.append("%% %s\n" % name)
+        has_cycle = False
         for spline in curvedata.splines:
             if spline.type == "BEZIER":
-                knots = []
-                handles = []
-                # Build lists of knots and handles
-                for point in spline.bezier_points:
-                    h1 = point.handle_left
-                    knot = point.co
-                    h2 = point.handle_right
-                    handles.extend([h1, h2])
-                    knots.append("(+%.4f,+%.4f)" % (knot.x, knot.y)) # todo: fix string conversion
+                # Gather knots and handles in bulk instead of touching each
+                # bezier point from Python.
+                n = len(spline.bezier_points)
+                co = np.empty(n * 3, dtype=np.float32)
+                spline.bezier_points.foreach_get("co", co)
+                co = co.reshape(n, 3)[:, :2]
+                hl = np.empty(n * 3, dtype=np.float32)
+                spline.bezier_points.foreach_get("handle_left", hl)
+                hr = np.empty(n * 3, dtype=np.float32)
+                spline.bezier_points.foreach_get("handle_right", hr)
+                # Interleave so the handles alternate left, right per knot.
+                handles = np.empty((2 * n, 2), dtype=np.float32)
+                handles[0::2] = hl.reshape(n, 3)[:, :2]
+                handles[1::2] = hr.reshape(n, 3)[:, :2]
 
                 if spline.use_cyclic_u:
+                    has_cycle = True
                     # The curve is closed.
-                    # Move the first handle to the end of the handles list.
-                    handles = handles[1:] + [handles[0]]
-                    # Repeat the first knot at the end of the knot list
-                    knots.append(knots[0])
+                    # Move the first handle to the end of the handles array.
+                    handles = np.roll(handles, -1, axis=0)
                 else:
                     # We don't need the first and last handles since the curve is
                     # not closed.
                     handles = handles[1:-1]
-                hh = []
-                for h1, h2 in nsplit(handles, 2):
-                    hh.append("controls (+%.4f,+%.4f) and (+%.4f,+%.4f)" % (h1.x, h1.y, h2.x, h2.y))
+                pairs = handles.reshape(-1, 2, 2)
 
-                ps += "%s\n" % knots[0]
-                for h, k in zip(hh, knots[1:]):
-                    ps += "  .. %s .. %s\n" % (h, k)
-                if spline.use_cyclic_u:
-                    ps += "  -- cycle\n"
+                if _format_bezier_path is not None:
+                    out = _format_bezier_path(co, pairs, bool(spline.use_cyclic_u), WRAP_LINES)
+                    ps_parts.append(out.tobytes().decode('ascii'))
+                else:
+                    knots = ["(+%.4f,+%.4f)" % (k[X], k[Y]) for k in co]
+                    if spline.use_cyclic_u:
+                        # Repeat the first knot at the end of the knot list
+                        knots.append(knots[0])
+                    hh = []
+                    for h1, h2 in pairs:
+                        hh.append("controls (+%.4f,+%.4f) and (+%.4f,+%.4f)" % (h1[X], h1[Y], h2[X], h2[Y]))
+
+                    sep = "\n" if WRAP_LINES else " "
+                    indent = "  " if WRAP_LINES else ""
+                    ps_parts.append(knots[0] + sep)
+                    for h, k in zip(hh, knots[1:]):
+                        ps_parts.append("%s.. %s .. %s%s" % (indent, h, k, sep))
+                    if spline.use_cyclic_u:
+                        ps_parts.append(indent + "-- cycle" + sep)
             elif spline.type == "POLY":
-                coords = [f"(+{point.co.x}.4f,+{point.co.y}.4f)" for point in spline.SplinePoint]
+                # Poly points are stored as 4D (x, y, z, w); gather them in
+                # bulk and keep only X and Y.
+                n = len(spline.points)
+                buf = np.empty(n * 4, dtype=np.float32)
+                spline.points.foreach_get("co", buf)
+                xy = buf.reshape(n, 4)[:, :2]
+                coords = format_coords(xy)
 
                 if USE_PLOTPATH:
                     plotopts = get_property(obj, 'plotstyle')
@@ -330,38 +514,45 @@ def write_object(obj, empties, USE_PLOTPATH, WRAP_LINES, DRAW_CURVE, FILL_CLOSED
                         poptstr = "[%s]" % ",".join(plotopts)
                     else:
                         poptstr = ''
-                    ps += " plot%s coordinates {%s}" % (poptstr, " ".join(coords))
+                    body = coords[:]
+                    if body:
+                        body[0] = "{" + body[0]
+                        body[-1] = body[-1] + "}"
+                    else:
+                        body = ["{}"]
+                    tokens = ["plot%s" % poptstr, "coordinates"] + body
                     if spline.use_cyclic_u:
-                        ps += " -- cycle"
+                        has_cycle = True
+                        tokens.extend(["--", "cycle"])
                     if WRAP_LINES:
-                        ps = "\n".join(wrap(ps, 80, subsequent_indent="  ", break_long_words=False))
+                        ps_parts.append(wrap_tokens(tokens))
+                    else:
+                        ps_parts.append(" ".join(tokens) + " ")
 
                 else:
                     if spline.use_cyclic_u:
-                        coords.extend([coords[0], 'cycle\n  '])
+                        has_cycle = True
+                        coords.append(coords[0])
                     # Join the coordinates. Could have used "--".join(coords), but
                     # have to add some logic for pretty printing.
+                    tokens = [coords[0]] + ["-- %s" % c for c in coords[1:]]
+                    if spline.use_cyclic_u:
+                        tokens.append("-- cycle")
                     if WRAP_LINES:
-                        ps += "%s\n  " % coords[0]
-                        i = 0
-                        for c in coords[1:]:
-                            i += 1
-                            if i % 3:
-                                ps += "-- %s" % c
-                            else:
-                                ps += "  -- %s\n  " % c
+                        ps_parts.append(wrap_tokens(tokens))
                     else:
-                        ps += "%s" % " -- ".join(coords)
+                        ps_parts.append(" ".join(tokens) + " ")
             else:
                 continue
 
+        ps = "".join(ps_parts)
         if not ps:
-            return s
+            return "".join(s_parts)
         options = []
         if DRAW_CURVE:
             options += ['draw']
         if FILL_CLOSED_CURVE:
-            if ps.find('cycle') > 0:
+            if has_cycle:
                 options += ['fill']
         if TRANSFORM_CURVE:
             if x != 0: options.append('xshift=%.4fcm' % x)
@@ -378,7 +569,7 @@ def write_object(obj, empties, USE_PLOTPATH, WRAP_LINES, DRAW_CURVE, FILL_CLOSED
                 # pick first material
                 for mat in materials:
                     if mat:
-                        matopts = get_material(mat)
+                        matopts = get_material(mat, used_materials)
                         options.append(matopts)
                         break
         extraopts = get_property(obj, 'style')
@@ -386,8 +577,9 @@ def write_object(obj, empties, USE_PLOTPATH, WRAP_LINES, DRAW_CURVE, FILL_CLOSED
             options.extend(extraopts)
 
         optstr = ",".join(options)
-        print("Options: ", options)
-        emptstr = ""
+        if DEBUG:
+            print("Options: ", options)
+        emptstr_parts = []
         if EMPTIES:
             if obj in empties:
                 for empty in empties[obj]:
@@ -396,20 +588,19 @@ def write_object(obj, empties, USE_PLOTPATH, WRAP_LINES, DRAW_CURVE, FILL_CLOSED
                         ex, ey, ez = (empty.mat * (obj.mat.copy()).invert()).translationPart
                     else:
                         ex, ey, ez = (empty.matrix - obj.matrix).translation
-                    emptstr += "  (+%.4f,+%.4f) coordinate (%s)\n" \
-                               % (ex, ey, empty.name)
+                    emptstr_parts.append("  (+%.4f,+%.4f) coordinate (%s)\n"
+                                         % (ex, ey, empty.name))
+        emptstr = "".join(emptstr_parts)
 
-        if not WRAP_LINES:
-            ps = ' '.join(ps.replace('\n', ' ').split())
         if len(optstr) > 50 or emptstr:
-            s += "\\path[%s]\n%s  %s;\n" % (optstr, emptstr, ps.rstrip())
+            s_parts.append("\\path[%s]\n%s  %s;\n" % (optstr, emptstr, ps.rstrip()))
         else:
-            s += "\\path[%s] %s;\n" % (optstr, ps.rstrip())
-    elif obj.type == 'Empty' and EMPTIES and not obj.parent:
-        x, y, z = obj.matrix_world.translation
-        s += "\\coordinate (%s) at (%.4f,%.4f);\n" % (tikzify(obj.name), x, y)
+            s_parts.append("\\path[%s] %s;\n" % (optstr, ps.rstrip()))
+    elif obj_type == 'Empty' and EMPTIES and not obj.parent:
+        x, y, z = world_translation
+        s_parts.append("\\coordinate (%s) at (%.4f,%.4f);\n" % (tikzify(name), x, y))
 
-    return s
+    return "".join(s_parts)
 
 
 
@@ -423,47 +614,65 @@ def write_tex(context, filepath, USE_PLOTPATH, WRAP_LINES, DRAW_CURVE, FILL_CLOS
         # no objects selected. Print error message and quit
         return 'ERROR: Please select at least one curve'
     else:
-        def z_comp(a, b):
-            x, y, z1 = a.matrix_world.translation
-            x, y, z2 = b.matrix_world.translation
-            return cmp(z1, z2)
-
+        # Names may have been edited since the last export, so drop any
+        # cached tikzify results before reusing it.
+        tikzify.cache_clear()
         # get all selected objects
         objects = context.selected_objects
+        # Read the transform and identity of every object once up front;
+        # each bpy prop access is a C round trip, so later stages work on
+        # these plain tuples instead of re-fetching from RNA. Objects that
+        # cannot be exported only need their Z for the draw order sort, and
+        # location/rotation/scale are only consumed when transforms are
+        # applied to curves.
+        obj_info = {}
+        for obj in objects:
+            obj_type = obj.type
+            if obj_type not in ("CURVE", "Empty"):
+                obj_info[obj] = (obj_type, None, None, None, None,
+                                 tuple(obj.matrix_world.translation))
+                continue
+            if obj_type == "CURVE" and TRANSFORM_CURVE:
+                location = tuple(obj.location)
+                rot_z = obj.rotation_euler.z
+                scale = tuple(obj.scale)
+            else:
+                location = (0.0, 0.0, 0.0)
+                rot_z = 0.0
+                scale = (1.0, 1.0, 1.0)
+            obj_info[obj] = (obj_type, obj.name, location, rot_z, scale,
+                             tuple(obj.matrix_world.translation))
         # get current scene
         scn = context.scene
         # iterate over each object
-        code = ""
-        # Find all empties with parents
-        empties_wp = [obj for obj in objects if obj.type == 'Empty' and obj.parent]
-        empties_dict = {}
-        for empty in empties_wp:
-            if empty.parent in empties_dict:
-                empties_dict[empty.parent] += [empty]
-            else:
-                empties_dict[empty.parent] = [empty]
-
-        for obj in sorted(objects, key=functools.cmp_to_key(z_comp)):
-            code += write_object(obj, empties_dict, USE_PLOTPATH, WRAP_LINES, DRAW_CURVE, FILL_CLOSED_CURVE,
-                                 TRANSFORM_CURVE, EXPORT_MATERIALS, EMPTIES)
+        code_parts = []
+        # Materials referenced by this export only; a module level dict would
+        # accumulate stale entries across repeated exports.
+        used_materials = {}
+        # Group the empties that have parents by their parent object
+        empties_dict = defaultdict(list)
+        for obj in objects:
+            if obj.type == 'Empty' and obj.parent:
+                empties_dict[obj.parent].append(obj)
+
+        # Draw order: sort by the cached world space Z coordinate.
+        for obj in sorted(objects, key=lambda o: obj_info[o][5][2]):
+            code_parts.append(write_object(obj, obj_info[obj], empties_dict, used_materials, USE_PLOTPATH,
+                                           WRAP_LINES, DRAW_CURVE, FILL_CLOSED_CURVE, TRANSFORM_CURVE,
+                                           EXPORT_MATERIALS, EMPTIES))
+        code = "".join(code_parts)
         s = ""
         if EXPORT_MATERIALS:
             matcode = write_materials(used_materials, ONLY_PROPERTIES)
         else:
             matcode = ""
 
-        try:
-            preamblecode = scn.properties['preamble']
-        except:
-            preamblecode = ''
+        scn_props = getattr(scn, 'properties', None)
+        preamblecode = scn_props.get('preamble', '') if scn_props is not None else ''
         templatevars = dict(pathcode=code, preamble=preamblecode, materials=matcode)
         if STANDALONE:
-            extra = ""
-            try:
-                preambleopt = scn.properties['preamble']
-                templatevars['preamble'] = str(preambleopt)
-            except:
-                pass
+            if preamblecode:
+                templatevars['preamble'] = str(preamblecode)
             template = standalone_template
 
         elif CODE_ONLY:
@@ -473,13 +682,13 @@ def write_tex(context, filepath, USE_PLOTPATH, WRAP_LINES, DRAW_CURVE, FILL_CLOS
 
         s = template % templatevars
         if not CLIPBOARD_OUTPUT:
-            print(s)
+            # Prepend the header and write everything in one go with a large
+            # buffer instead of dumping the document to the console first.
+            out = '%%%% Generated by tikz_export.py v %s \n%s' % (str(bl_info["version"]), s)
             try:
-                with open(filepath, 'w') as f:
-                    # write header to file
-                    f.write('%% Generated by tikz_export.py v %s \n' % str(bl_info["version"]))
-                    f.write(s)
-                    print(f"Code written to {filepath}")
+                with open(filepath, 'w', buffering=1 << 20) as f:
+                    f.write(out)
+                print(f"Code written to {filepath}")
                 return "File sucesfully writen"
             except Exception as error:
                 print("Wirte File Fail:", error)
@@ -657,6 +866,7 @@ def register():
 
     bpy.utils.register_class(TechFileExport)
     bpy.types.TOPBAR_MT_file_export.append(menu_export)
+    _warm_numba()
 
 
 def unregister():